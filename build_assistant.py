@@ -8,17 +8,28 @@ with the proper JSON payload for the MermAId API.
 Usage:
     python3 build_assistant.py
 
+Optional: the module is fully annotated and can be compiled with mypyc.
+Running the file directly always uses the source, so import the compiled
+module instead:
+    mypyc build_assistant.py
+    python3 -c "import build_assistant; raise SystemExit(build_assistant.main())"
+
 The script expects:
     - Prompt.md in the same directory (or configure PROMPT_MD_PATH)
     - .env file with MERMAID_TOKEN, MERMAID_ASSISTANT_ID, MERMAID_ACCOUNT_ID
 
 Output:
     - update_assistant.sh - Executable script to update the assistant via API
+    - update_assistant.json - JSON payload sent by update_assistant.sh
+    - .build_cache.json - Last payload and output stats, reused while nothing changed
 """
 
+from __future__ import annotations
+
 import re
 import json
 import os
+import sys
 from pathlib import Path
 
 # =============================================================================
@@ -29,10 +40,12 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).parent
 PROMPT_MD_PATH = SCRIPT_DIR / "Prompt.md"
 OUTPUT_SCRIPT_PATH = SCRIPT_DIR / "update_assistant.sh"
+OUTPUT_PAYLOAD_PATH = SCRIPT_DIR / "update_assistant.json"
+BUILD_CACHE_PATH = SCRIPT_DIR / ".build_cache.json"
 
 # Fixed values that don't come from Prompt.md
 # Edit these for your specific assistant
-FIXED_VALUES = {
+FIXED_VALUES: dict[str, str] = {
     "assistantName": "Your Assistant Name",
     "organizationName": "Your Organization",
     "organizationBusiness": "Brief description of your business.",
@@ -46,141 +59,237 @@ UTM_PARAMS = "utm_source=whatsapp&utm_medium=iara&utm_campaign=assistant&utm_con
 # Base checkout URL to apply UTMs to (optional)
 CHECKOUT_BASE_URL = "https://your-checkout-url.com"
 
+# =============================================================================
+# PATTERNS - Compiled once at import time
+# =============================================================================
+
+# Prompt.md is scanned as raw UTF-8 bytes (all markers are found byte-wise);
+# only the extracted slices are decoded to str. The one exception is the UTM
+# substitution, which decodes the content when it contains a checkout link.
+
+# Section markers and the boundaries that end each section (a section ends at
+# the first boundary found, which must start a line)
+_SECTION_END = (b"\n## ", b"\n---")
+_PRODUTO_HEADER = b"## SOBRE O PRODUTO"
+_PRODUTO_END = ("\n**Dores que o produto resolve".encode("utf-8"), "\n**Informações importantes".encode("utf-8"))
+_INFO_LABEL = "**Informações importantes:**".encode("utf-8")
+_INFO_END = _SECTION_END + ("\n**Link de compra".encode("utf-8"),)
+_DORES_LABEL = "**Dores que o produto resolve:**".encode("utf-8")
+_DORES_END = _SECTION_END + ("\n**Informações importantes".encode("utf-8"),)
+_PERFIL_LABEL = "**Perfil do seu público:**".encode("utf-8")
+
+# Checkout links, with or without an existing query string. The link ends at
+# whitespace or ')' (so '[x](URL?a=b)' keeps its paren); links followed by
+# anything else (e.g. a path) are left untouched.
+# This is a str pattern on purpose: in a bytes pattern \S would run past
+# non-ASCII whitespace such as a non-breaking space and eat the following text.
+_RE_CHECKOUT: re.Pattern[str] | None = None
+_URL_WITH_UTM = ""
+_CHECKOUT_BYTES = b""
+if CHECKOUT_BASE_URL and UTM_PARAMS:
+    _URL_WITH_UTM = f"{CHECKOUT_BASE_URL}?{UTM_PARAMS}"
+    _CHECKOUT_BYTES = CHECKOUT_BASE_URL.encode("utf-8")
+    _RE_CHECKOUT = re.compile(re.escape(CHECKOUT_BASE_URL) + r'(?:\?[^\s)]*)?(?![^\s)])')
+
+# Markdown bold cleanup - '**Label:**' and '**text**' in a single pass
+_RE_BOLD_ANY = re.compile(r'\*\*(.+?)(:)?\*\*')
+
 # =============================================================================
 # EXTRACTION FUNCTIONS
 # =============================================================================
 
-def read_prompt_md():
+def _section(content: bytes, marker: bytes, boundaries: tuple[bytes, ...] = _SECTION_END) -> str | None:
+    """
+    Returns the text between a marker and the first of the given boundaries,
+    or None if no marker is followed by a boundary.
+    Equivalent to re.search(marker + r'\s*\n(.*?)(?=boundary|...)', re.DOTALL)
+    but built on bytes.find, so there is no regex backtracking.
+    """
+    start = content.find(marker)
+    while start != -1:
+        # Like 'marker\s*\n': the rest of the marker's line must be whitespace;
+        # the body starts after the last newline of that whitespace run
+        ws_start = start + len(marker)
+        ws_end = ws_start
+        while ws_end < len(content) and content[ws_end] in b" \t\n\r\f\v":
+            ws_end += 1
+        newline = content.rfind(b"\n", ws_start, ws_end)
+        if newline != -1:
+            body_start = newline + 1
+            end = -1
+            for boundary in boundaries:
+                # Only search up to the nearest boundary found so far
+                idx = content.find(boundary, body_start, end + len(boundary) if end != -1 else len(content))
+                if idx != -1 and (end == -1 or idx < end):
+                    end = idx
+            if end != -1:
+                return content[body_start:end].decode("utf-8")
+            # Regex backtracking case: the whitespace run has another newline
+            # and a boundary starts at its last one, giving a blank body
+            previous = content.rfind(b"\n", ws_start, newline)
+            if previous != -1 and any(content.startswith(boundary, newline) for boundary in boundaries):
+                return content[previous + 1:newline].decode("utf-8")
+        start = content.find(marker, start + 1)
+    return None
+
+
+def _strip_bold(text: str) -> str:
+    """Removes markdown bold markers, keeping a trailing colon if present"""
+    return _RE_BOLD_ANY.sub(r'\1\2', text)
+
+
+def read_prompt_md() -> bytes:
     """Reads the Prompt.md file"""
-    with open(PROMPT_MD_PATH, "r", encoding="utf-8") as f:
-        return f.read()
+    # One read of the whole file, kept as bytes (see PATTERNS above).
+    # Normalize CRLF ourselves since text-mode newline translation is bypassed.
+    return PROMPT_MD_PATH.read_bytes().replace(b"\r\n", b"\n")
 
 
-def build_prompt_postlude(content: str) -> str:
+def build_prompt_postlude(content: bytes) -> str:
     """
     Builds promptPostlude from all sections starting at ## FLUXO DE ATENDIMENTO
     This is where all the conversation guidance goes.
     """
-    start_marker = "## FLUXO DE ATENDIMENTO"
+    start_marker = b"## FLUXO DE ATENDIMENTO"
     start_idx = content.find(start_marker)
     
     if start_idx == -1:
         # Fallback: try finding after a separator
-        start_idx = content.find("---\n\n## FLUXO")
+        start_idx = content.find(b"---\n\n## FLUXO")
         if start_idx != -1:
-            start_idx = content.find("## FLUXO", start_idx)
+            start_idx = content.find(b"## FLUXO", start_idx)
     
     if start_idx == -1:
         raise ValueError("Section '## FLUXO DE ATENDIMENTO' not found in Prompt.md")
     
-    postlude_content = content[start_idx:]
+    postlude_content = content[start_idx:].decode("utf-8").rstrip()
     
     # Remove trailing markdown code blocks if any
-    postlude_content = re.sub(r'\n```\s*$', '', postlude_content)
+    if postlude_content.endswith("\n```"):
+        postlude_content = postlude_content[:-4]
     
     return postlude_content.strip()
 
 
-def build_assistant_role(content: str) -> str:
+def build_assistant_role(content: bytes) -> str:
     """Extracts the IDENTIDADE section for assistantRole"""
-    pattern = r'## IDENTIDADE\s*\n(.*?)(?=\n---|\n## )'
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        role = match.group(1).strip()
+    role = (_section(content, b"## IDENTIDADE") or "").strip()
+    if role:
         # Get just the first paragraph (main description)
-        first_para = role.split('\n\n')[0]
+        first_para = role.partition('\n\n')[0]
         # Remove markdown formatting
-        first_para = re.sub(r'\*\*(.+?)\*\*', r'\1', first_para)
+        first_para = _strip_bold(first_para)
         return first_para
     return ""
 
 
-def build_assistant_personality(content: str) -> str:
+def build_assistant_personality(content: bytes) -> str:
     """Extracts PERSONALIDADE E TOM DE VOZ for assistantPersonality"""
-    pattern = r'## PERSONALIDADE E TOM DE VOZ\s*\n(.*?)(?=\n---|\n## )'
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        personality = match.group(1).strip()
+    personality = (_section(content, b"## PERSONALIDADE E TOM DE VOZ") or "").strip()
+    if personality:
         # Remove markdown bold formatting
-        personality = re.sub(r'\*\*(.+?):\*\*', r'\1:', personality)
-        personality = re.sub(r'\*\*(.+?)\*\*', r'\1', personality)
+        personality = _strip_bold(personality)
         return personality
     return ""
 
 
-def build_organization_info(content: str) -> list:
+def build_organization_info(content: bytes) -> list[str]:
     """Extracts product information for organizationInfo array"""
-    info = []
+    info: list[str] = []
     
     # 1. SOBRE O PRODUTO - main product info
-    pattern = r'## SOBRE O PRODUTO\s*\n(.*?)(?=\n\*\*Dores que o produto resolve|\n\*\*Informações importantes)'
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        produto = match.group(1).strip()
-        produto = re.sub(r'\*\*(.+?):\*\*', r'\1:', produto)
-        produto = re.sub(r'\*\*(.+?)\*\*', r'\1', produto)
+    produto = _section(content, _PRODUTO_HEADER, _PRODUTO_END)
+    if produto is not None:
+        produto = _strip_bold(produto.strip())
         info.append(f"PRODUTO:\n{produto}")
     
     # 2. INFORMAÇÕES IMPORTANTES (price, access, etc)
-    pattern = r'\*\*Informações importantes:\*\*\s*\n(.*?)(?=\n\*\*Link de compra|\n---|\n## )'
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        preco = match.group(1).strip()
-        preco = re.sub(r'\*\*(.+?):\*\*', r'\1:', preco)
-        preco = re.sub(r'\*\*(.+?)\*\*', r'\1', preco)
+    preco = _section(content, _INFO_LABEL, _INFO_END)
+    if preco is not None:
+        preco = _strip_bold(preco.strip())
         
         # Add link with UTM if configured
-        if CHECKOUT_BASE_URL and UTM_PARAMS:
-            link = f"{CHECKOUT_BASE_URL}?{UTM_PARAMS}"
-            info.append(f"PREÇO E ACESSO:\n{preco}\n\nLink de compra: {link}")
+        if _URL_WITH_UTM:
+            info.append(f"PREÇO E ACESSO:\n{preco}\n\nLink de compra: {_URL_WITH_UTM}")
         else:
             info.append(f"PREÇO E ACESSO:\n{preco}")
     
     # 3. DORES QUE O PRODUTO RESOLVE
-    pattern = r'\*\*Dores que o produto resolve:\*\*\s*\n(.*?)(?=\n\*\*Informações importantes|\n---|\n## )'
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        dores = match.group(1).strip()
-        info.append(f"DORES QUE O PRODUTO RESOLVE:\n{dores}")
+    dores = _section(content, _DORES_LABEL, _DORES_END)
+    if dores is not None:
+        info.append(f"DORES QUE O PRODUTO RESOLVE:\n{dores.strip()}")
     
     # 4. PERFIL DO PÚBLICO (from IDENTIDADE section)
-    pattern = r'\*\*Perfil do seu público:\*\*\s*\n(.*?)(?=\n---|\n## )'
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        perfil = match.group(1).strip()
-        info.append(f"PERFIL DO PÚBLICO:\n{perfil}")
+    perfil = _section(content, _PERFIL_LABEL)
+    if perfil is not None:
+        info.append(f"PERFIL DO PÚBLICO:\n{perfil.strip()}")
     
     return info
 
 
-def add_utm_to_links(content: str) -> str:
+def add_utm_to_links(content: bytes) -> bytes:
     """Adds UTM params to checkout links in the content"""
-    if not CHECKOUT_BASE_URL or not UTM_PARAMS:
+    if _RE_CHECKOUT is None:
+        return content
+    
+    # Cheap substring check before running the regex engine
+    if _CHECKOUT_BYTES not in content:
         return content
     
-    url_with_utm = f"{CHECKOUT_BASE_URL}?{UTM_PARAMS}"
+    # Single pass: bare links get the UTMs, existing query strings are replaced.
+    # Matched on str so whitespace is Unicode-aware (see _RE_CHECKOUT).
+    return _RE_CHECKOUT.sub(_URL_WITH_UTM, content.decode("utf-8")).encode("utf-8")
+
+
+def build_payload(content: bytes) -> dict[str, str | list[str]]:
+    """Builds the API payload from the Prompt.md content"""
+    # Add UTMs to links
+    content = add_utm_to_links(content)
+    
+    print("🔍 Extracting sections...")
+    
+    # Build the payload
+    payload: dict[str, str | list[str]] = {
+        "assistantName": FIXED_VALUES["assistantName"],
+        "organizationName": FIXED_VALUES["organizationName"],
+        "organizationBusiness": FIXED_VALUES["organizationBusiness"],
+        "promptPrelude": FIXED_VALUES["promptPrelude"],
+    }
     
-    # Replace base URL with UTM version
-    content = content.replace(CHECKOUT_BASE_URL + "\n", url_with_utm + "\n")
-    content = content.replace(CHECKOUT_BASE_URL + " ", url_with_utm + " ")
-    content = content.replace(CHECKOUT_BASE_URL + ")", url_with_utm + ")")
+    # Extract sections from Prompt.md
+    payload["assistantRole"] = build_assistant_role(content)
+    payload["assistantPersonality"] = build_assistant_personality(content)
+    payload["organizationInfo"] = build_organization_info(content)
+    payload["promptPostlude"] = build_prompt_postlude(content)
     
-    # Don't duplicate UTMs if already present
-    content = re.sub(rf'{re.escape(CHECKOUT_BASE_URL)}\?[^\s\n]+', url_with_utm, content)
+    # Validate, then report everything in a single write
+    report = [
+        f"⚠️  {field} is empty!"
+        for field in ("assistantRole", "assistantPersonality", "organizationInfo", "promptPostlude")
+        if not payload[field]
+    ]
+    report.append(f"✅ assistantRole: {len(payload['assistantRole'])} chars")
+    report.append(f"✅ assistantPersonality: {len(payload['assistantPersonality'])} chars")
+    report.append(f"✅ organizationInfo: {len(payload['organizationInfo'])} items")
+    report.append(f"✅ promptPostlude: {len(payload['promptPostlude'])} chars")
+    sys.stdout.write("\n".join(report) + "\n")
     
-    return content
+    return payload
 
 
 # =============================================================================
 # SCRIPT GENERATION
 # =============================================================================
 
-def generate_update_script(payload: dict) -> str:
-    """Generates the bash update script"""
-    
-    json_payload = json.dumps({"options": payload}, indent=2, ensure_ascii=False)
-    
-    script = f'''#!/bin/bash
+def generate_payload_json(payload: dict[str, str | list[str]]) -> str:
+    """Generates the JSON request body sent by the update script"""
+    # Compact separators keep the payload small; jq pretty-prints the response
+    return json.dumps({"options": payload}, ensure_ascii=False, separators=(",", ":"))
+
+
+# Update script template, split around the payload file name. Plain strings,
+# so bash's ${VAR} references need no escaping; joined once at import time.
+_SCRIPT_HEADER = '''#!/bin/bash
 
 # =============================================================================
 # MermAId Assistant Update Script
@@ -192,19 +301,20 @@ def generate_update_script(payload: dict) -> str:
 source "$(dirname "$0")/.env"
 
 # API endpoint
-API_URL="https://api.mermaid.chat/api/assistants/${{MERMAID_ASSISTANT_ID}}"
+API_URL="https://api.mermaid.chat/api/assistants/${MERMAID_ASSISTANT_ID}"
+
+# JSON payload, generated next to this script
+PAYLOAD_FILE="$(dirname "$0")/'''
 
-# JSON payload
-read -r -d '' PAYLOAD << 'EOF'
-{json_payload}
-EOF
+_SCRIPT_FOOTER = '''"
+[ -f "$PAYLOAD_FILE" ] || { echo "missing $PAYLOAD_FILE - run build_assistant.py first" >&2; exit 1; }
 
 # Make the API call
-echo "Updating assistant ${{MERMAID_ASSISTANT_ID}}..."
+echo "Updating assistant ${MERMAID_ASSISTANT_ID}..."
 response=$(curl -s -X PATCH "$API_URL" \\
-  -H "Authorization: Bearer ${{MERMAID_TOKEN}}" \\
+  -H "Authorization: Bearer ${MERMAID_TOKEN}" \\
   -H "Content-Type: application/json" \\
-  -d "$PAYLOAD")
+  --data-binary @"$PAYLOAD_FILE")
 
 # Check if jq is available for pretty printing
 if command -v jq &> /dev/null; then
@@ -216,66 +326,103 @@ fi
 echo ""
 echo "Done!"
 '''
-    
-    return script
+
+_UPDATE_SCRIPT = "".join((_SCRIPT_HEADER, OUTPUT_PAYLOAD_PATH.name, _SCRIPT_FOOTER))
+
+
+def generate_update_script() -> str:
+    """Generates the bash update script"""
+    return _UPDATE_SCRIPT
+
+
+def _write_file(path: Path, data: bytes, mode: int) -> None:
+    """Writes data straight to a raw fd and sets its mode"""
+    # The creation mode only applies to new files (and is masked by umask),
+    # so fchmod is still needed when overwriting an existing file.
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+        os.fchmod(fd, mode)
+    finally:
+        os.close(fd)
+
+
+# =============================================================================
+# BUILD CACHE
+# =============================================================================
+
+def _cache_key() -> list[int]:
+    """Cache key: mtime and size of Prompt.md and of this script (its config)"""
+    prompt_stat = PROMPT_MD_PATH.stat()
+    script_stat = os.stat(__file__)
+    return [prompt_stat.st_mtime_ns, prompt_stat.st_size, script_stat.st_mtime_ns, script_stat.st_size]
+
+
+def _outputs_key() -> list[int] | None:
+    """mtime and size of the generated files, or None if either is missing"""
+    try:
+        script_stat = OUTPUT_SCRIPT_PATH.stat()
+        payload_stat = OUTPUT_PAYLOAD_PATH.stat()
+    except OSError:
+        return None
+    return [script_stat.st_mtime_ns, script_stat.st_size, payload_stat.st_mtime_ns, payload_stat.st_size]
+
+
+def _load_cache() -> dict[str, object]:
+    """Loads the last build cache, or an empty dict if missing/unreadable"""
+    try:
+        cache = json.loads(BUILD_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(key: list[int], outputs: list[int] | None, payload: dict[str, str | list[str]]) -> None:
+    """Persists the cache keys and payload; a failed write only costs a rebuild"""
+    cache = {"key": key, "outputs": outputs, "payload": payload}
+    try:
+        BUILD_CACHE_PATH.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass
 
 
 # =============================================================================
 # MAIN
 # =============================================================================
 
-def main():
+def main() -> int:
     print(f"📖 Reading Prompt.md from: {PROMPT_MD_PATH}")
     
     if not PROMPT_MD_PATH.exists():
         print(f"❌ File not found: {PROMPT_MD_PATH}")
         return 1
     
-    content = read_prompt_md()
-    
-    # Add UTMs to links
-    content = add_utm_to_links(content)
-    
-    print("🔍 Extracting sections...")
-    
-    # Build the payload
-    payload = {
-        "assistantName": FIXED_VALUES["assistantName"],
-        "organizationName": FIXED_VALUES["organizationName"],
-        "organizationBusiness": FIXED_VALUES["organizationBusiness"],
-        "promptPrelude": FIXED_VALUES["promptPrelude"],
-    }
-    
-    # Extract sections from Prompt.md
-    payload["assistantRole"] = build_assistant_role(content)
-    payload["assistantPersonality"] = build_assistant_personality(content)
-    payload["organizationInfo"] = build_organization_info(content)
-    payload["promptPostlude"] = build_prompt_postlude(content)
-    
-    # Validate
-    if not payload["assistantRole"]:
-        print("⚠️  assistantRole is empty!")
-    if not payload["assistantPersonality"]:
-        print("⚠️  assistantPersonality is empty!")
-    if not payload["organizationInfo"]:
-        print("⚠️  organizationInfo is empty!")
-    if not payload["promptPostlude"]:
-        print("⚠️  promptPostlude is empty!")
-    
-    print(f"✅ assistantRole: {len(payload['assistantRole'])} chars")
-    print(f"✅ assistantPersonality: {len(payload['assistantPersonality'])} chars")
-    print(f"✅ organizationInfo: {len(payload['organizationInfo'])} items")
-    print(f"✅ promptPostlude: {len(payload['promptPostlude'])} chars")
+    # Skip the extraction entirely when Prompt.md (and this script) are unchanged
+    key = _cache_key()
+    cache = _load_cache()
+    cached = cache.get("payload")
+    if cache.get("key") == key and isinstance(cached, dict):
+        # Outputs must be exactly the files this script last wrote, not e.g.
+        # an older update_assistant.sh restored by git
+        outputs = _outputs_key()
+        if outputs is not None and cache.get("outputs") == outputs:
+            print("✅ Prompt.md unchanged - update_assistant.sh and its payload are up-to-date")
+            return 0
+        print("♻️  Prompt.md unchanged - regenerating outputs from cached payload")
+        payload = cached
+    else:
+        payload = build_payload(read_prompt_md())
     
-    # Generate the script
-    print(f"\n📝 Generating script: {OUTPUT_SCRIPT_PATH}")
-    script = generate_update_script(payload)
+    # Generate the payload and the script that sends it
+    print(f"\n📝 Generating payload: {OUTPUT_PAYLOAD_PATH}")
+    _write_file(OUTPUT_PAYLOAD_PATH, generate_payload_json(payload).encode("utf-8"), 0o644)
     
-    with open(OUTPUT_SCRIPT_PATH, "w", encoding="utf-8") as f:
-        f.write(script)
+    print(f"📝 Generating script: {OUTPUT_SCRIPT_PATH}")
+    _write_file(OUTPUT_SCRIPT_PATH, generate_update_script().encode("utf-8"), 0o755)
     
-    # Make executable
-    os.chmod(OUTPUT_SCRIPT_PATH, 0o755)
+    _save_cache(key, _outputs_key(), payload)
     
     print("✅ Script generated successfully!")
     print(f"\n🚀 To update your assistant, run:")